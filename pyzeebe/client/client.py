@@ -1,23 +1,121 @@
-from typing import Any, Dict, Iterable, Optional, Tuple
+import asyncio
+import functools
+import itertools
+import types
+from typing import (
+    Any,
+    Awaitable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+)
 
 import grpc
 from typing_extensions import deprecated
 
+from pyzeebe.client.message_id_filter import MessageIdFilter
+from pyzeebe.client.rate_limiter import AIMDRateLimiter
+from pyzeebe.errors import MessageAlreadyExistsError
 from pyzeebe.grpc_internals.zeebe_adapter import ZeebeAdapter
 from pyzeebe.types import Variables
 
+T = TypeVar("T")
+
+_EMPTY_VARIABLES: Mapping[str, Any] = types.MappingProxyType({})
+# Channels with the same target and options share their connection unless they use their own subchannel pool
+_POOL_CHANNEL_OPTIONS: Dict[str, Any] = {"grpc.use_local_subchannel_pool": 1}
+
+
+class ChannelFactory(Protocol):
+    def __call__(self, *, channel_options: Optional[Dict[str, Any]] = None) -> grpc.aio.Channel:
+        ...
+
 
 class ZeebeClient:
     """A zeebe client that can connect to a zeebe instance and perform actions."""
 
-    def __init__(self, grpc_channel: grpc.aio.Channel, max_connection_retries: int = 10) -> None:
+    __slots__ = ("_adapters", "_adapter_counter", "_pool_channels", "_message_id_filter", "_rate_limiter")
+
+    def __init__(
+        self,
+        grpc_channel: grpc.aio.Channel,
+        max_connection_retries: int = 10,
+        channel_factory: Optional[ChannelFactory] = None,
+        pool_size: int = 4,
+        deduplicate_messages: bool = False,
+        adaptive_rate_limit: bool = False,
+        rpc_timeout: Optional[float] = 30,
+    ) -> None:
         """
         Args:
             grpc_channel (grpc.aio.Channel): GRPC Channel connected to a Zeebe gateway
             max_connection_retries (int): Amount of connection retries before client gives up on connecting to zeebe. To setup with infinite retries use -1
+            channel_factory (ChannelFactory): Creates additional channels to the same Zeebe gateway. It is called with
+                                a channel_options keyword argument that gives each channel its own connection, like the
+                                pyzeebe create_*_channel functions accept. If given, requests are spread round-robin over
+                                a pool of pool_size channels. The client owns these channels, see close.
+                                channel_options replaces the factory's own, merge them in the factory to keep them.
+            pool_size (int): Amount of channels in the pool, including grpc_channel. Only used with channel_factory. Default: 4
+            deduplicate_messages (bool): Remember recently published message ids and raise MessageAlreadyExistsError
+                                for duplicates without sending them to Zeebe. Default: False
+            adaptive_rate_limit (bool): Pace requests and halve their rate when Zeebe reports back pressure. The
+                                rate grows by one request per second every second after that. Default: False
+            rpc_timeout (Optional[float]): Seconds to wait for the gateway to answer a request before giving up on it.
+                                run_process_with_result waits this long on top of its own timeout.
+                                None waits forever. Default: 30
+        """
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be at least 1, got {pool_size}")
+        if isinstance(channel_factory, functools.partial) and "channel_options" in channel_factory.keywords:
+            raise ValueError(
+                "channel_factory must merge channel_options instead of binding them with functools.partial"
+            )
+
+        self._pool_channels: List[grpc.aio.Channel] = []
+        if channel_factory is not None:
+            self._pool_channels = [
+                channel_factory(channel_options=dict(_POOL_CHANNEL_OPTIONS)) for _ in range(pool_size - 1)
+            ]
+
+        self._adapters = [
+            ZeebeAdapter(channel, max_connection_retries, rpc_timeout)
+            for channel in [grpc_channel, *self._pool_channels]
+        ]
+        self._adapter_counter = itertools.count()
+        self._message_id_filter = MessageIdFilter() if deduplicate_messages else None
+        self._rate_limiter = AIMDRateLimiter() if adaptive_rate_limit else None
+
+    @property
+    def zeebe_adapter(self) -> ZeebeAdapter:
+        """The adapter of grpc_channel, which is the first adapter of the channel pool"""
+        return self._adapters[0]
+
+    @zeebe_adapter.setter
+    def zeebe_adapter(self, zeebe_adapter: ZeebeAdapter) -> None:
+        self._adapters[0] = zeebe_adapter
+
+    async def close(self) -> None:
         """
+        Close the channels created by channel_factory.
+
+        grpc_channel is not closed, it is owned by the caller.
+        """
+        await asyncio.gather(*(channel.close() for channel in self._pool_channels))
+
+    def _next_adapter(self) -> ZeebeAdapter:
+        return self._adapters[next(self._adapter_counter) % len(self._adapters)]
 
-        self.zeebe_adapter = ZeebeAdapter(grpc_channel, max_connection_retries)
+    def _rate_limited(self, request: Coroutine[Any, Any, T]) -> Awaitable[T]:
+        # Without a rate limiter the request is awaited directly, so there is no overhead
+        if self._rate_limiter is None:
+            return request
+        return self._rate_limiter.run(request)
 
     async def run_process(
         self,
@@ -48,8 +146,13 @@ class ZeebeClient:
             UnknownGrpcStatusCodeError: If Zeebe returns an unexpected status code
 
         """
-        return await self.zeebe_adapter.create_process_instance(
-            bpmn_process_id=bpmn_process_id, variables=variables or {}, version=version, tenant_id=tenant_id
+        return await self._rate_limited(
+            self._next_adapter().create_process_instance(
+                bpmn_process_id,
+                version,
+                variables if variables is not None else _EMPTY_VARIABLES,
+                tenant_id,
+            )
         )
 
     async def run_process_with_result(
@@ -86,13 +189,25 @@ class ZeebeClient:
             UnknownGrpcStatusCodeError: If Zeebe returns an unexpected status code
 
         """
-        return await self.zeebe_adapter.create_process_instance_with_result(
-            bpmn_process_id=bpmn_process_id,
-            variables=variables or {},
-            version=version,
-            timeout=timeout,
-            variables_to_fetch=variables_to_fetch or [],
-            tenant_id=tenant_id,
+        if variables_to_fetch:
+            return await self._rate_limited(
+                self._next_adapter().create_process_instance_with_result(
+                    bpmn_process_id,
+                    version,
+                    variables if variables is not None else _EMPTY_VARIABLES,
+                    timeout,
+                    variables_to_fetch,
+                    tenant_id,
+                )
+            )
+        return await self._rate_limited(
+            self._next_adapter().create_process_instance_with_result_all(
+                bpmn_process_id,
+                version,
+                variables if variables is not None else _EMPTY_VARIABLES,
+                timeout,
+                tenant_id,
+            )
         )
 
     async def cancel_process_instance(self, process_instance_key: int) -> int:
@@ -113,7 +228,7 @@ class ZeebeClient:
             UnknownGrpcStatusCodeError: If Zeebe returns an unexpected status code
 
         """
-        await self.zeebe_adapter.cancel_process_instance(process_instance_key=process_instance_key)
+        await self._rate_limited(self._next_adapter().cancel_process_instance(process_instance_key))
         return process_instance_key
 
     @deprecated("Deprecated since Zeebe 8.0. Use deploy_resource instead")
@@ -132,7 +247,7 @@ class ZeebeClient:
             UnknownGrpcStatusCodeError: If Zeebe returns an unexpected status code
 
         """
-        await self.zeebe_adapter.deploy_process(*process_file_path)
+        await self._rate_limited(self._next_adapter().deploy_process(*process_file_path))
 
     async def deploy_resource(self, *resource_file_path: str, tenant_id: Optional[str] = None) -> None:
         """
@@ -152,7 +267,7 @@ class ZeebeClient:
             UnknownGrpcStatusCodeError: If Zeebe returns an unexpected status code
 
         """
-        await self.zeebe_adapter.deploy_resource(*resource_file_path, tenant_id=tenant_id)
+        await self._rate_limited(self._next_adapter().deploy_resource(*resource_file_path, tenant_id=tenant_id))
 
     async def publish_message(
         self,
@@ -183,11 +298,18 @@ class ZeebeClient:
             UnknownGrpcStatusCodeError: If Zeebe returns an unexpected status code
 
         """
-        await self.zeebe_adapter.publish_message(
-            name=name,
-            correlation_key=correlation_key,
-            time_to_live_in_milliseconds=time_to_live_in_milliseconds,
-            variables=variables or {},
-            message_id=message_id,
-            tenant_id=tenant_id,
+        if self._message_id_filter is not None and self._message_id_filter.contains(name, message_id, tenant_id):
+            raise MessageAlreadyExistsError()
+
+        await self._rate_limited(
+            self._next_adapter().publish_message(
+                name,
+                correlation_key,
+                time_to_live_in_milliseconds,
+                variables if variables is not None else _EMPTY_VARIABLES,
+                message_id,
+                tenant_id,
+            )
         )
+        if self._message_id_filter is not None:
+            self._message_id_filter.add(name, message_id, time_to_live_in_milliseconds, tenant_id)
@@ -0,0 +1,84 @@
+import hashlib
+import math
+import time
+from typing import List, Optional
+
+
+class _BloomFilter:
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.size = max(1, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def add(self, key: bytes) -> None:
+        for index in self._indexes(key):
+            self._bits[index >> 3] |= 1 << (index & 7)
+        self.count += 1
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(self._bits[index >> 3] & (1 << (index & 7)) for index in self._indexes(key))
+
+    def _indexes(self, key: bytes) -> List[int]:
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+
+class MessageIdFilter:
+    """
+    Remembers recently published message ids to detect duplicates without asking the gateway.
+
+    Ids are kept in two bloom filters that are rotated every rotation interval, so an id is remembered for
+    less than two rotation intervals. Only messages that live at least two rotation intervals in Zeebe are
+    recorded, which means an id is never remembered longer than Zeebe itself would reject it.
+    """
+
+    def __init__(self, capacity: int = 2**16, error_rate: float = 0.001, rotation_interval_ms: int = 30000) -> None:
+        """
+        Args:
+            capacity (int): Amount of ids a single filter holds before it is rotated. Default: 65536
+            error_rate (float): Chance of reporting an id as seen when it is not. Default: 0.001
+            rotation_interval_ms (int): How often the filters are rotated. Default: 30000 ms (30 seconds)
+        """
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._rotation_interval_ms = rotation_interval_ms
+        self._current = _BloomFilter(capacity, error_rate)
+        self._previous = _BloomFilter(capacity, error_rate)
+        self._epoch = self._current_epoch()
+
+    def add(
+        self, name: str, message_id: Optional[str], time_to_live_in_milliseconds: int, tenant_id: Optional[str] = None
+    ) -> None:
+        if message_id is None or time_to_live_in_milliseconds < 2 * self._rotation_interval_ms:
+            return
+        self._rotate()
+        if self._current.count >= self._capacity:
+            self._previous, self._current = self._current, _BloomFilter(self._capacity, self._error_rate)
+        self._current.add(_create_key(name, message_id, tenant_id))
+
+    def contains(self, name: str, message_id: Optional[str], tenant_id: Optional[str] = None) -> bool:
+        if message_id is None:
+            return False
+        self._rotate()
+        key = _create_key(name, message_id, tenant_id)
+        return key in self._current or key in self._previous
+
+    def _rotate(self) -> None:
+        epoch = self._current_epoch()
+        if epoch == self._epoch:
+            return
+        if epoch == self._epoch + 1:
+            self._previous = self._current
+        else:
+            self._previous = _BloomFilter(self._capacity, self._error_rate)
+        self._current = _BloomFilter(self._capacity, self._error_rate)
+        self._epoch = epoch
+
+    def _current_epoch(self) -> int:
+        return int(time.monotonic() * 1000 // self._rotation_interval_ms)
+
+
+def _create_key(name: str, message_id: str, tenant_id: Optional[str]) -> bytes:
+    return "\0".join((tenant_id or "", name, message_id)).encode()
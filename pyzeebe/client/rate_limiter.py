@@ -0,0 +1,73 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Coroutine, Optional, TypeVar
+
+from pyzeebe.errors import ZeebeBackPressureError
+
+T = TypeVar("T")
+
+
+class AIMDRateLimiter:
+    """
+    Paces requests to Zeebe and adapts the rate to the gateway's back pressure.
+
+    The rate grows by rate_increase requests per second for every second of successful requests and is halved when
+    Zeebe reports back pressure (additive increase, multiplicative decrease). Back pressure reported for requests
+    sent before the last decrease is ignored, so a burst of rejected requests halves the rate only once.
+    """
+
+    def __init__(
+        self, initial_rate: float = 1000, min_rate: float = 10, max_rate: float = 10000, rate_increase: float = 1
+    ) -> None:
+        """
+        Args:
+            initial_rate (float): Requests per second allowed at the start. Default: 1000
+            min_rate (float): The rate never drops below this amount of requests per second. Default: 10
+            max_rate (float): The rate never rises above this amount of requests per second. Default: 10000
+            rate_increase (float): Requests per second added to the rate for every second of successful requests.
+                Default: 1
+        """
+        self.rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate_increase = rate_increase
+        self._next_request_at = 0.0
+        self._last_increase_at = time.monotonic()
+        self._decreased_before = 0.0
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        now = time.monotonic()
+        request_at = max(now, self._next_request_at)
+        self._next_request_at = request_at + 1 / self.rate
+        if request_at > now:
+            await asyncio.sleep(request_at - now)
+
+        try:
+            yield
+        except ZeebeBackPressureError:
+            self.on_overload(request_at)
+            raise
+        self.on_success()
+
+    async def run(self, request: Coroutine[Any, Any, T]) -> T:
+        try:
+            async with self.acquire():
+                return await request
+        finally:
+            # closes the request if it was never started, e.g. when cancelled while waiting for the rate
+            request.close()
+
+    def on_overload(self, request_at: Optional[float] = None) -> None:
+        if request_at is not None and request_at < self._decreased_before:
+            # the request was sent at the old rate, which has already been decreased
+            return
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._decreased_before = self._next_request_at
+        self._last_increase_at = time.monotonic()
+
+    def on_success(self) -> None:
+        now = time.monotonic()
+        self.rate = min(self.max_rate, self.rate + self.rate_increase * (now - self._last_increase_at))
+        self._last_increase_at = now
@@ -5,13 +5,31 @@ import grpc
 from typing_extensions import deprecated
 
 from pyzeebe import ZeebeClient
+from pyzeebe.client.client import ChannelFactory
 from pyzeebe.types import Variables
 
 
 class SyncZeebeClient:
-    def __init__(self, grpc_channel: grpc.aio.Channel, max_connection_retries: int = 10) -> None:
+    def __init__(
+        self,
+        grpc_channel: grpc.aio.Channel,
+        max_connection_retries: int = 10,
+        channel_factory: Optional[ChannelFactory] = None,
+        pool_size: int = 4,
+        deduplicate_messages: bool = False,
+        adaptive_rate_limit: bool = False,
+        rpc_timeout: Optional[float] = 30,
+    ) -> None:
         self.loop = asyncio.get_event_loop()
-        self.client = ZeebeClient(grpc_channel, max_connection_retries)
+        self.client = ZeebeClient(
+            grpc_channel,
+            max_connection_retries,
+            channel_factory,
+            pool_size,
+            deduplicate_messages,
+            adaptive_rate_limit,
+            rpc_timeout,
+        )
 
     def run_process(
         self,
@@ -66,3 +84,6 @@ class SyncZeebeClient:
                 tenant_id,
             )
         )
+
+    def close(self) -> None:
+        return self.loop.run_until_complete(self.client.close())
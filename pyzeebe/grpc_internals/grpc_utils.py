@@ -1,5 +1,14 @@
+import json
+from typing import Any, Mapping
+
 import grpc
 
 
 def is_error_status(rpc_error: grpc.aio.AioRpcError, *status_codes: grpc.StatusCode) -> bool:
     return rpc_error.code() in status_codes
+
+
+def serialize_variables(variables: Mapping[str, Any]) -> str:
+    if not variables:
+        return "{}"
+    return json.dumps(variables if isinstance(variables, dict) else dict(variables))
@@ -1,5 +1,5 @@
 import logging
-from typing import NoReturn
+from typing import NoReturn, Optional
 
 import grpc
 from zeebe_grpc.gateway_pb2_grpc import GatewayStub
@@ -17,13 +17,17 @@ logger = logging.getLogger(__name__)
 
 
 class ZeebeAdapterBase:
-    def __init__(self, grpc_channel: grpc.aio.Channel, max_connection_retries: int = -1):
+    def __init__(
+        self, grpc_channel: grpc.aio.Channel, max_connection_retries: int = -1, rpc_timeout: Optional[float] = None
+    ):
         self._channel = grpc_channel
         self._gateway_stub = GatewayStub(grpc_channel)
         self.connected = True
         self.retrying_connection = False
         self._max_connection_retries = max_connection_retries
         self._current_connection_retries = 0
+        # deadline in seconds for unary requests made on behalf of the client, None means no deadline
+        self._rpc_timeout = rpc_timeout
 
     def _should_retry(self) -> bool:
         return self._max_connection_retries == -1 or self._current_connection_retries < self._max_connection_retries
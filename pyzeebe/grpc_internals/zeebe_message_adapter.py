@@ -1,37 +1,68 @@
-import json
-from typing import Optional
+import functools
+from typing import Any, Mapping, Optional, cast
 
 import grpc
 from zeebe_grpc.gateway_pb2 import PublishMessageRequest, PublishMessageResponse
 
 from pyzeebe.errors import MessageAlreadyExistsError
-from pyzeebe.grpc_internals.grpc_utils import is_error_status
+from pyzeebe.grpc_internals.grpc_utils import is_error_status, serialize_variables
 from pyzeebe.grpc_internals.zeebe_adapter_base import ZeebeAdapterBase
-from pyzeebe.types import Variables
 
 
 class ZeebeMessageAdapter(ZeebeAdapterBase):
+    def __init__(
+        self, grpc_channel: grpc.aio.Channel, max_connection_retries: int = -1, rpc_timeout: Optional[float] = None
+    ):
+        super().__init__(grpc_channel, max_connection_retries, rpc_timeout)
+        # Same RPC as the gateway stub's PublishMessage, but sends requests that are already serialized
+        self._publish_serialized_message = grpc_channel.unary_unary(
+            "/gateway_protocol.Gateway/PublishMessage",
+            request_serializer=None,
+            response_deserializer=PublishMessageResponse.FromString,
+        )
+
     async def publish_message(
         self,
         name: str,
         correlation_key: str,
         time_to_live_in_milliseconds: int,
-        variables: Variables,
+        variables: Mapping[str, Any],
         message_id: Optional[str] = None,
         tenant_id: Optional[str] = None,
     ) -> PublishMessageResponse:
         try:
+            if not variables and message_id is None:
+                return await self._publish_serialized_message(
+                    _serialize_signal_request(name, correlation_key, time_to_live_in_milliseconds, tenant_id),
+                    timeout=self._rpc_timeout,
+                )
             return await self._gateway_stub.PublishMessage(
                 PublishMessageRequest(
                     name=name,
                     correlationKey=correlation_key,
                     messageId=message_id,
                     timeToLive=time_to_live_in_milliseconds,
-                    variables=json.dumps(variables),
+                    variables=serialize_variables(variables),
                     tenantId=tenant_id,
-                )
+                ),
+                timeout=self._rpc_timeout,
             )
         except grpc.aio.AioRpcError as grpc_error:
             if is_error_status(grpc_error, grpc.StatusCode.ALREADY_EXISTS):
                 raise MessageAlreadyExistsError() from grpc_error
             await self._handle_grpc_error(grpc_error)
+
+
+@functools.lru_cache(maxsize=1024)
+def _serialize_signal_request(
+    name: str, correlation_key: str, time_to_live_in_milliseconds: int, tenant_id: Optional[str]
+) -> bytes:
+    # Messages without variables and message id are often published many times with the same fields
+    request = PublishMessageRequest(
+        name=name,
+        correlationKey=correlation_key,
+        timeToLive=time_to_live_in_milliseconds,
+        variables=serialize_variables({}),
+        tenantId=tenant_id,
+    )
+    return cast(bytes, request.SerializeToString())
@@ -1,6 +1,7 @@
+import asyncio
 import json
 import os
-from typing import Any, Dict, Iterable, NoReturn, Optional, Tuple, cast
+from typing import Any, Dict, Iterable, Mapping, NoReturn, Optional, Tuple, cast
 
 import aiofiles
 import grpc
@@ -25,9 +26,8 @@ from pyzeebe.errors import (
     ProcessInvalidError,
     ProcessTimeoutError,
 )
-from pyzeebe.grpc_internals.grpc_utils import is_error_status
+from pyzeebe.grpc_internals.grpc_utils import is_error_status, serialize_variables
 from pyzeebe.grpc_internals.zeebe_adapter_base import ZeebeAdapterBase
-from pyzeebe.types import Variables
 
 
 class ZeebeProcessAdapter(ZeebeAdapterBase):
@@ -35,17 +35,13 @@ class ZeebeProcessAdapter(ZeebeAdapterBase):
         self,
         bpmn_process_id: str,
         version: int,
-        variables: Variables,
+        variables: Mapping[str, Any],
         tenant_id: Optional[str] = None,
     ) -> int:
         try:
             response = await self._gateway_stub.CreateProcessInstance(
-                CreateProcessInstanceRequest(
-                    bpmnProcessId=bpmn_process_id,
-                    version=version,
-                    variables=json.dumps(variables),
-                    tenantId=tenant_id,
-                )
+                _create_process_instance_request(bpmn_process_id, version, variables, tenant_id),
+                timeout=self._rpc_timeout,
             )
         except grpc.aio.AioRpcError as grpc_error:
             await self._create_process_errors(grpc_error, bpmn_process_id, version, variables)
@@ -55,30 +51,60 @@ class ZeebeProcessAdapter(ZeebeAdapterBase):
         self,
         bpmn_process_id: str,
         version: int,
-        variables: Variables,
+        variables: Mapping[str, Any],
         timeout: int,
         variables_to_fetch: Iterable[str],
         tenant_id: Optional[str] = None,
+    ) -> Tuple[int, Dict[str, Any]]:
+        return await self._create_process_instance_with_result(
+            CreateProcessInstanceWithResultRequest(
+                request=_create_process_instance_request(bpmn_process_id, version, variables, tenant_id),
+                requestTimeout=timeout,
+                fetchVariables=variables_to_fetch,
+            ),
+            timeout,
+            bpmn_process_id,
+            version,
+            variables,
+        )
+
+    async def create_process_instance_with_result_all(
+        self,
+        bpmn_process_id: str,
+        version: int,
+        variables: Mapping[str, Any],
+        timeout: int,
+        tenant_id: Optional[str] = None,
+    ) -> Tuple[int, Dict[str, Any]]:
+        return await self._create_process_instance_with_result(
+            CreateProcessInstanceWithResultRequest(
+                request=_create_process_instance_request(bpmn_process_id, version, variables, tenant_id),
+                requestTimeout=timeout,
+            ),
+            timeout,
+            bpmn_process_id,
+            version,
+            variables,
+        )
+
+    async def _create_process_instance_with_result(
+        self,
+        request: CreateProcessInstanceWithResultRequest,
+        timeout: int,
+        bpmn_process_id: str,
+        version: int,
+        variables: Mapping[str, Any],
     ) -> Tuple[int, Dict[str, Any]]:
         try:
-            response = await self._gateway_stub.CreateProcessInstanceWithResult(
-                CreateProcessInstanceWithResultRequest(
-                    request=CreateProcessInstanceRequest(
-                        bpmnProcessId=bpmn_process_id,
-                        version=version,
-                        variables=json.dumps(variables),
-                        tenantId=tenant_id,
-                    ),
-                    requestTimeout=timeout,
-                    fetchVariables=variables_to_fetch,
-                )
-            )
+            # the gateway waits up to timeout ms for the result, so the deadline has to leave room for that
+            deadline = None if self._rpc_timeout is None else timeout / 1000 + self._rpc_timeout
+            response = await self._gateway_stub.CreateProcessInstanceWithResult(request, timeout=deadline)
         except grpc.aio.AioRpcError as grpc_error:
             await self._create_process_errors(grpc_error, bpmn_process_id, version, variables)
         return response.processInstanceKey, json.loads(response.variables)
 
     async def _create_process_errors(
-        self, grpc_error: grpc.aio.AioRpcError, bpmn_process_id: str, version: int, variables: Dict[str, Any]
+        self, grpc_error: grpc.aio.AioRpcError, bpmn_process_id: str, version: int, variables: Mapping[str, Any]
     ) -> NoReturn:
         if is_error_status(grpc_error, grpc.StatusCode.NOT_FOUND):
             raise ProcessDefinitionNotFoundError(bpmn_process_id=bpmn_process_id, version=version) from grpc_error
@@ -95,7 +121,7 @@ class ZeebeProcessAdapter(ZeebeAdapterBase):
     async def cancel_process_instance(self, process_instance_key: int) -> None:
         try:
             await self._gateway_stub.CancelProcessInstance(
-                CancelProcessInstanceRequest(processInstanceKey=process_instance_key)
+                CancelProcessInstanceRequest(processInstanceKey=process_instance_key), timeout=self._rpc_timeout
             )
         except grpc.aio.AioRpcError as grpc_error:
             if is_error_status(grpc_error, grpc.StatusCode.NOT_FOUND):
@@ -106,9 +132,8 @@ class ZeebeProcessAdapter(ZeebeAdapterBase):
     async def deploy_process(self, *process_file_path: str) -> DeployProcessResponse:
         try:
             return await self._gateway_stub.DeployProcess(
-                DeployProcessRequest(
-                    processes=[await result for result in map(_create_process_request, process_file_path)]
-                )
+                DeployProcessRequest(processes=await asyncio.gather(*map(_create_process_request, process_file_path))),
+                timeout=self._rpc_timeout,
             )
         except grpc.aio.AioRpcError as grpc_error:
             if is_error_status(grpc_error, grpc.StatusCode.INVALID_ARGUMENT):
@@ -121,9 +146,10 @@ class ZeebeProcessAdapter(ZeebeAdapterBase):
         try:
             return await self._gateway_stub.DeployResource(
                 DeployResourceRequest(
-                    resources=[await result for result in map(_create_resource_request, resource_file_path)],
+                    resources=await asyncio.gather(*map(_create_resource_request, resource_file_path)),
                     tenantId=tenant_id,
-                )
+                ),
+                timeout=self._rpc_timeout,
             )
         except grpc.aio.AioRpcError as grpc_error:
             if is_error_status(grpc_error, grpc.StatusCode.INVALID_ARGUMENT):
@@ -131,6 +157,17 @@ class ZeebeProcessAdapter(ZeebeAdapterBase):
             await self._handle_grpc_error(grpc_error)
 
 
+def _create_process_instance_request(
+    bpmn_process_id: str, version: int, variables: Mapping[str, Any], tenant_id: Optional[str]
+) -> CreateProcessInstanceRequest:
+    return CreateProcessInstanceRequest(
+        bpmnProcessId=bpmn_process_id,
+        version=version,
+        variables=serialize_variables(variables),
+        tenantId=tenant_id,
+    )
+
+
 async def _create_process_request(process_file_path: str) -> ProcessRequestObject:
     async with aiofiles.open(process_file_path, "rb") as file:
         return ProcessRequestObject(name=os.path.basename(process_file_path), definition=await file.read())
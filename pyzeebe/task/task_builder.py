@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import functools
 import logging
-from typing import Any, Dict, Sequence, Tuple, TypeVar
+from typing import Any, Dict, Optional, Sequence, Tuple, TypeVar
 
 from typing_extensions import ParamSpec
 
@@ -39,12 +39,14 @@ def build_job_handler(task_function: Function[..., Any], task_config: TaskConfig
         if task_config.job_parameter_name:
             job.variables[task_config.job_parameter_name] = create_copy(job)
 
-        job = await before_decorator_runner(job)
+        if before_decorator_runner is not None:
+            job = await before_decorator_runner(job)
         original_return_value, succeeded = await run_original_task_function(prepared_task_function, task_config, job)
         job.variables.update(original_return_value)
         job.variables.pop(task_config.job_parameter_name, None)  # type: ignore[arg-type]
         await job.set_running_after_decorators_status()
-        job = await after_decorator_runner(job)
+        if after_decorator_runner is not None:
+            job = await after_decorator_runner(job)
         if succeeded:
             await job.set_success_status()
         return job
@@ -87,9 +89,17 @@ async def run_original_task_function(
         return job.variables, False
 
 
-def create_decorator_runner(decorators: Sequence[AsyncTaskDecorator]) -> DecoratorRunner:
+def create_decorator_runner(decorators: Sequence[AsyncTaskDecorator]) -> Optional[DecoratorRunner]:
+    # there is nothing to run, so the job handler can skip awaiting a runner for every job
+    if not decorators:
+        return None
+    if len(decorators) == 1:
+        return functools.partial(run_decorator, decorators[0])
+
+    frozen_decorators = tuple(decorators)
+
     async def decorator_runner(job: Job) -> Job:
-        for decorator in decorators:
+        for decorator in frozen_decorators:
             job = await run_decorator(decorator, job)
         return job
 
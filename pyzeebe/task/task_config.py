@@ -1,3 +1,4 @@
+import sys
 from typing import Iterable, List, Optional
 
 from pyzeebe.errors import NoVariableNameGivenError
@@ -26,7 +27,8 @@ class TaskConfig:
         if single_value and not variable_name:
             raise NoVariableNameGivenError(type)
 
-        self.type = type
+        # task types are dictionary keys in the task router, interning them lets lookups compare by identity
+        self.type = sys.intern(type)
         self.exception_handler = exception_handler
         self.timeout_ms = timeout_ms
         self.max_jobs_to_activate = max_jobs_to_activate
@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import Callable
+from typing import Callable, Set
 
 from pyzeebe.errors import JobAlreadyDeactivatedError
 from pyzeebe.job.job import Job
@@ -18,11 +18,15 @@ class JobExecutor:
         self.jobs = jobs
         self.task_state = task_state
         self.stop_event = asyncio.Event()
+        # the event loop only keeps weak references to tasks, so running jobs are kept here until they are done
+        self.running_jobs: "Set[asyncio.Task[None]]" = set()
 
     async def execute(self) -> None:
         while self.should_execute():
             job = await self.get_next_job()
             task = asyncio.create_task(self.execute_one_job(job))
+            self.running_jobs.add(task)
+            task.add_done_callback(self.running_jobs.discard)
             task.add_done_callback(create_job_callback(self, job))
 
     async def get_next_job(self) -> Job:
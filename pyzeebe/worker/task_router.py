@@ -4,11 +4,14 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Literal,
     Optional,
+    Sequence,
     Tuple,
     TypeVar,
+    Union,
     overload,
 )
 
@@ -30,7 +33,51 @@ RD = TypeVar("RD", bound=Optional[Dict[str, Any]])
 logger = logging.getLogger(__name__)
 
 
+class _TaskListView(Sequence[Task]):
+    """List-like view over the tasks of a router, which are stored by type"""
+
+    __slots__ = ("_tasks",)
+
+    def __init__(self, tasks: Dict[str, Task]) -> None:
+        self._tasks = tasks
+
+    def append(self, task: Task) -> None:
+        if task.type in self._tasks:
+            raise DuplicateTaskTypeError(task.type)
+        self._tasks[task.type] = task
+
+    def remove(self, task: Task) -> None:
+        if task not in self:
+            raise ValueError(f"{task} is not in the tasks")
+        del self._tasks[task.type]
+
+    def __contains__(self, task: object) -> bool:
+        return isinstance(task, Task) and self._tasks.get(task.type) is task
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self._tasks.values())
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    @overload
+    def __getitem__(self, index: int) -> Task:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Task]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Task, List[Task]]:
+        return list(self._tasks.values())[index]
+
+    def __repr__(self) -> str:
+        return repr(list(self._tasks.values()))
+
+
 class ZeebeTaskRouter:
+    __slots__ = ("_tasks", "_task_list", "_before", "_after", "_exception_handler")
+
     def __init__(
         self,
         before: Optional[List[TaskDecorator]] = None,
@@ -43,10 +90,21 @@ class ZeebeTaskRouter:
             after (List[TaskDecorator]): Decorators to be performed after each task
             exception_handler (ExceptionHandler): Handler that will be called when a job fails.
         """
-        self._exception_handler = exception_handler
-        self._before: List[TaskDecorator] = before or []
-        self._after: List[TaskDecorator] = after or []
-        self.tasks: List[Task] = []
+        self._exception_handler: Optional[ExceptionHandler] = exception_handler
+        self._before: List[TaskDecorator] = list(before) if before else []
+        self._after: List[TaskDecorator] = list(after) if after else []
+        self._tasks: Dict[str, Task] = {}
+        self._task_list = _TaskListView(self._tasks)
+
+    @property
+    def tasks(self) -> _TaskListView:
+        """
+        The tasks of this router in registration order.
+
+        The view is read-only apart from append, which raises DuplicateTaskTypeError for an already registered type,
+        and remove.
+        """
+        return self._task_list
 
     @overload
     def task(
@@ -141,7 +199,7 @@ class ZeebeTaskRouter:
 
     def _add_task(self, task: Task) -> None:
         self._is_task_duplicate(task.type)
-        self.tasks.append(task)
+        self._tasks[task.type] = task
 
     def _add_decorators_to_config(self, config: TaskConfig) -> TaskConfig:
         new_task_config = TaskConfig(
@@ -159,11 +217,8 @@ class ZeebeTaskRouter:
         return new_task_config
 
     def _is_task_duplicate(self, task_type: str) -> None:
-        try:
-            self.get_task(task_type)
+        if task_type in self._tasks:
             raise DuplicateTaskTypeError(task_type)
-        except TaskNotFoundError:
-            return
 
     def before(self, *decorators: TaskDecorator) -> None:
         """
@@ -206,8 +261,10 @@ class ZeebeTaskRouter:
              TaskNotFoundError: If no task with specified type exists
 
         """
-        task_index = self._get_task_index(task_type)
-        return self.tasks.pop(task_index)
+        task = self._tasks.pop(task_type, None)
+        if task is None:
+            raise TaskNotFoundError(f"Could not find task {task_type}")
+        return task
 
     def get_task(self, task_type: str) -> Task:
         """
@@ -223,13 +280,14 @@ class ZeebeTaskRouter:
              TaskNotFoundError: If no task with specified type exists
 
         """
-        return self._get_task_and_index(task_type)[0]
+        task = self._tasks.get(task_type)
+        if task is None:
+            raise TaskNotFoundError(f"Could not find task {task_type}")
+        return task
 
     def _get_task_index(self, task_type: str) -> int:
         return self._get_task_and_index(task_type)[1]
 
     def _get_task_and_index(self, task_type: str) -> Tuple[Task, int]:
-        for index, task in enumerate(self.tasks):
-            if task.type == task_type:
-                return task, index
-        raise TaskNotFoundError(f"Could not find task {task_type}")
+        task = self.get_task(task_type)
+        return task, list(self._tasks).index(task_type)
@@ -1,10 +1,22 @@
+import asyncio
+import functools
 from random import randint
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
+import grpc
 import pytest
+from zeebe_grpc.gateway_pb2 import PublishMessageResponse
+from zeebe_grpc.gateway_pb2_grpc import GatewayServicer, add_GatewayServicer_to_server
 
-from pyzeebe.errors import ProcessDefinitionNotFoundError
+from pyzeebe import ZeebeClient
+from pyzeebe.channel.insecure_channel import create_insecure_channel
+from pyzeebe.errors import (
+    MessageAlreadyExistsError,
+    ProcessDefinitionNotFoundError,
+    ZeebeBackPressureError,
+)
+from pyzeebe.grpc_internals.zeebe_adapter import ZeebeAdapter
 
 
 @pytest.mark.asyncio
@@ -34,6 +46,26 @@ class TestRunProcessWithResult:
 
         assert output_variables == expected
 
+    async def test_fetches_all_variables_by_default(self, zeebe_client):
+        zeebe_client.zeebe_adapter.create_process_instance_with_result_all = AsyncMock(return_value=(1, {}))
+        bpmn_process_id = str(uuid4())
+
+        await zeebe_client.run_process_with_result(bpmn_process_id)
+
+        zeebe_client.zeebe_adapter.create_process_instance_with_result_all.assert_called_once_with(
+            bpmn_process_id, -1, {}, 0, None
+        )
+
+    async def test_fetches_requested_variables(self, zeebe_client):
+        zeebe_client.zeebe_adapter.create_process_instance_with_result = AsyncMock(return_value=(1, {}))
+        bpmn_process_id = str(uuid4())
+
+        await zeebe_client.run_process_with_result(bpmn_process_id, variables_to_fetch=["x"])
+
+        zeebe_client.zeebe_adapter.create_process_instance_with_result.assert_called_once_with(
+            bpmn_process_id, -1, {}, 0, ["x"], None
+        )
+
 
 @pytest.mark.asyncio
 async def test_deploy_process(zeebe_client):
@@ -77,3 +109,156 @@ async def test_cancel_process_instance(zeebe_client, grpc_servicer):
 @pytest.mark.asyncio
 async def test_publish_message(zeebe_client):
     await zeebe_client.publish_message(name=str(uuid4()), correlation_key=str(uuid4()))
+
+
+class TestChannelPool:
+    def test_single_channel_by_default(self, zeebe_client):
+        assert zeebe_client._next_adapter() is zeebe_client.zeebe_adapter
+        assert zeebe_client._next_adapter() is zeebe_client.zeebe_adapter
+
+    def test_creates_pool_with_channel_factory(self, aio_grpc_channel: grpc.aio.Channel):
+        channel_factory = Mock(return_value=aio_grpc_channel)
+
+        zeebe_client = ZeebeClient(aio_grpc_channel, channel_factory=channel_factory, pool_size=3)
+
+        assert channel_factory.call_count == 2
+        channel_factory.assert_called_with(channel_options={"grpc.use_local_subchannel_pool": 1})
+        assert len(zeebe_client._adapters) == 3
+
+    def test_rejects_empty_pool(self, aio_grpc_channel: grpc.aio.Channel):
+        with pytest.raises(ValueError):
+            ZeebeClient(aio_grpc_channel, channel_factory=Mock(), pool_size=0)
+
+    def test_rejects_factory_with_bound_channel_options(self, aio_grpc_channel: grpc.aio.Channel):
+        channel_factory = functools.partial(create_insecure_channel, channel_options={"grpc.keepalive_time_ms": 1})
+
+        with pytest.raises(ValueError):
+            ZeebeClient(aio_grpc_channel, channel_factory=channel_factory)
+
+    async def test_pool_channels_use_own_connections(self):
+        peers = set()
+
+        class PeerRecordingGateway(GatewayServicer):
+            async def PublishMessage(self, request, context):
+                peers.add(context.peer())
+                return PublishMessageResponse()
+
+        server = grpc.aio.server()
+        add_GatewayServicer_to_server(PeerRecordingGateway(), server)
+        port = server.add_insecure_port("localhost:0")
+        await server.start()
+        channel_factory = functools.partial(create_insecure_channel, "localhost", port)
+        zeebe_client = ZeebeClient(channel_factory(), channel_factory=channel_factory, pool_size=4)
+        try:
+            await asyncio.gather(
+                *(zeebe_client.publish_message(name=str(uuid4()), correlation_key=str(uuid4())) for _ in range(40))
+            )
+        finally:
+            await zeebe_client.close()
+            await zeebe_client.zeebe_adapter._channel.close()
+            await server.stop(None)
+
+        assert len(peers) == 4
+
+    async def test_close_closes_only_factory_channels(self):
+        grpc_channel = Mock(close=AsyncMock())
+        pool_channels = [Mock(close=AsyncMock()) for _ in range(2)]
+        zeebe_client = ZeebeClient(grpc_channel, channel_factory=Mock(side_effect=pool_channels), pool_size=3)
+
+        await zeebe_client.close()
+
+        grpc_channel.close.assert_not_called()
+        for channel in pool_channels:
+            channel.close.assert_awaited_once()
+
+    def test_adapters_are_used_round_robin(self, aio_grpc_channel: grpc.aio.Channel):
+        zeebe_client = ZeebeClient(
+            aio_grpc_channel, channel_factory=lambda channel_options: aio_grpc_channel, pool_size=2
+        )
+
+        first, second, third = (zeebe_client._next_adapter() for _ in range(3))
+
+        assert first is zeebe_client.zeebe_adapter
+        assert second is not first
+        assert third is first
+
+    async def test_assigned_adapter_is_used(self, zeebe_client, aio_grpc_channel: grpc.aio.Channel):
+        zeebe_adapter = ZeebeAdapter(aio_grpc_channel)
+        zeebe_adapter.publish_message = AsyncMock()
+
+        zeebe_client.zeebe_adapter = zeebe_adapter
+        await zeebe_client.publish_message(name=str(uuid4()), correlation_key=str(uuid4()))
+
+        assert zeebe_client.zeebe_adapter is zeebe_adapter
+        zeebe_adapter.publish_message.assert_called_once()
+
+    async def test_requests_are_spread_over_pool(self, aio_grpc_channel: grpc.aio.Channel):
+        zeebe_client = ZeebeClient(
+            aio_grpc_channel, channel_factory=lambda channel_options: aio_grpc_channel, pool_size=2
+        )
+        for adapter in zeebe_client._adapters:
+            adapter._gateway_stub = Mock(PublishMessage=AsyncMock())
+
+        for _ in range(4):
+            await zeebe_client.publish_message(name=str(uuid4()), correlation_key=str(uuid4()), variables={"x": 1})
+
+        assert [adapter._gateway_stub.PublishMessage.call_count for adapter in zeebe_client._adapters] == [2, 2]
+
+
+@pytest.mark.asyncio
+class TestDeduplicateMessages:
+    async def test_raises_on_duplicate_without_request(self, aio_grpc_channel: grpc.aio.Channel):
+        zeebe_client = ZeebeClient(aio_grpc_channel, deduplicate_messages=True)
+        name, message_id = str(uuid4()), str(uuid4())
+        await zeebe_client.publish_message(name=name, correlation_key=str(uuid4()), message_id=message_id)
+        zeebe_client.zeebe_adapter.publish_message = AsyncMock()
+
+        with pytest.raises(MessageAlreadyExistsError):
+            await zeebe_client.publish_message(name=name, correlation_key=str(uuid4()), message_id=message_id)
+
+        zeebe_client.zeebe_adapter.publish_message.assert_not_called()
+
+    async def test_publishes_messages_without_id(self, aio_grpc_channel: grpc.aio.Channel):
+        zeebe_client = ZeebeClient(aio_grpc_channel, deduplicate_messages=True)
+        zeebe_client.zeebe_adapter.publish_message = AsyncMock()
+        name, correlation_key = str(uuid4()), str(uuid4())
+
+        await zeebe_client.publish_message(name=name, correlation_key=correlation_key)
+        await zeebe_client.publish_message(name=name, correlation_key=correlation_key)
+
+        assert zeebe_client.zeebe_adapter.publish_message.call_count == 2
+
+
+@pytest.mark.asyncio
+class TestAdaptiveRateLimit:
+    async def test_slows_down_on_back_pressure(self, aio_grpc_channel: grpc.aio.Channel):
+        zeebe_client = ZeebeClient(aio_grpc_channel, adaptive_rate_limit=True)
+        zeebe_client.zeebe_adapter.publish_message = AsyncMock(side_effect=ZeebeBackPressureError())
+        initial_rate = zeebe_client._rate_limiter.rate
+
+        with pytest.raises(ZeebeBackPressureError):
+            await zeebe_client.publish_message(name=str(uuid4()), correlation_key=str(uuid4()))
+
+        assert zeebe_client._rate_limiter.rate == initial_rate / 2
+
+
+async def test_requests_bypass_rate_limit_by_default(zeebe_client):
+    async def request():
+        return 1
+
+    pending_request = request()
+
+    assert zeebe_client._rate_limited(pending_request) is pending_request
+    assert await pending_request == 1
+
+
+def test_client_has_no_instance_dict(zeebe_client):
+    assert not hasattr(zeebe_client, "__dict__")
+
+
+def test_client_sets_rpc_timeout_on_adapters(aio_grpc_channel: grpc.aio.Channel):
+    zeebe_client = ZeebeClient(
+        aio_grpc_channel, channel_factory=lambda channel_options: aio_grpc_channel, pool_size=2, rpc_timeout=5
+    )
+
+    assert all(adapter._rpc_timeout == 5 for adapter in zeebe_client._adapters)
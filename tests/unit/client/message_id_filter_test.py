@@ -0,0 +1,90 @@
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+
+from pyzeebe.client.message_id_filter import MessageIdFilter
+
+
+@pytest.fixture
+def monotonic():
+    with mock.patch("pyzeebe.client.message_id_filter.time.monotonic", return_value=0.0) as monotonic_mock:
+        yield monotonic_mock
+
+
+@pytest.fixture
+def message_id_filter(monotonic) -> MessageIdFilter:
+    return MessageIdFilter(rotation_interval_ms=1000)
+
+
+class TestContains:
+    def test_unknown_id_is_not_contained(self, message_id_filter: MessageIdFilter):
+        assert not message_id_filter.contains(str(uuid4()), str(uuid4()))
+
+    def test_added_id_is_contained(self, message_id_filter: MessageIdFilter):
+        name, message_id = str(uuid4()), str(uuid4())
+
+        message_id_filter.add(name, message_id, 60000)
+
+        assert message_id_filter.contains(name, message_id)
+
+    def test_none_id_is_never_contained(self, message_id_filter: MessageIdFilter):
+        name = str(uuid4())
+
+        message_id_filter.add(name, None, 60000)
+
+        assert not message_id_filter.contains(name, None)
+
+    def test_id_is_scoped_to_tenant(self, message_id_filter: MessageIdFilter):
+        name, message_id = str(uuid4()), str(uuid4())
+
+        message_id_filter.add(name, message_id, 60000, tenant_id="a")
+
+        assert not message_id_filter.contains(name, message_id, tenant_id="b")
+
+    def test_short_lived_message_is_not_remembered(self, message_id_filter: MessageIdFilter):
+        name, message_id = str(uuid4()), str(uuid4())
+
+        message_id_filter.add(name, message_id, 1999)
+
+        assert not message_id_filter.contains(name, message_id)
+
+
+class TestRotation:
+    def test_id_survives_one_rotation(self, message_id_filter: MessageIdFilter, monotonic: mock.Mock):
+        name, message_id = str(uuid4()), str(uuid4())
+        message_id_filter.add(name, message_id, 60000)
+
+        monotonic.return_value = 1.5
+
+        assert message_id_filter.contains(name, message_id)
+
+    def test_id_is_forgotten_after_two_rotations(self, message_id_filter: MessageIdFilter, monotonic: mock.Mock):
+        name, message_id = str(uuid4()), str(uuid4())
+        message_id_filter.add(name, message_id, 60000)
+
+        monotonic.return_value = 1.5
+        message_id_filter.contains(name, message_id)
+        monotonic.return_value = 2.5
+
+        assert not message_id_filter.contains(name, message_id)
+
+    def test_id_is_forgotten_after_long_idle_period(self, message_id_filter: MessageIdFilter, monotonic: mock.Mock):
+        name, message_id = str(uuid4()), str(uuid4())
+        message_id_filter.add(name, message_id, 60000)
+
+        monotonic.return_value = 2.0
+
+        assert not message_id_filter.contains(name, message_id)
+
+    def test_rotates_when_full(self, monotonic):
+        message_id_filter = MessageIdFilter(capacity=2, rotation_interval_ms=1000)
+        name = str(uuid4())
+        message_ids = [str(uuid4()) for _ in range(3)]
+
+        for message_id in message_ids:
+            message_id_filter.add(name, message_id, 60000)
+
+        assert message_id_filter._previous.count == 2
+        assert message_id_filter._current.count == 1
+        assert all(message_id_filter.contains(name, message_id) for message_id in message_ids)
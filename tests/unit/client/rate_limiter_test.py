@@ -0,0 +1,143 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from pyzeebe.client.rate_limiter import AIMDRateLimiter
+from pyzeebe.errors import ZeebeBackPressureError, ZeebeGatewayUnavailableError
+
+
+@pytest.fixture
+def clock():
+    with mock.patch("pyzeebe.client.rate_limiter.time.monotonic", return_value=1000.0) as monotonic:
+        yield monotonic
+
+
+@pytest.fixture
+def rate_limiter(clock: mock.MagicMock) -> AIMDRateLimiter:
+    return AIMDRateLimiter(initial_rate=100, min_rate=10, max_rate=101, rate_increase=1)
+
+
+@pytest.fixture
+def sleep_mock():
+    with mock.patch("pyzeebe.client.rate_limiter.asyncio.sleep") as sleep:
+        yield sleep
+
+
+@pytest.mark.asyncio
+class TestAcquire:
+    async def test_first_request_is_not_delayed(self, rate_limiter: AIMDRateLimiter, sleep_mock: mock.AsyncMock):
+        async with rate_limiter.acquire():
+            pass
+
+        sleep_mock.assert_not_called()
+
+    async def test_paces_consecutive_requests(self, rate_limiter: AIMDRateLimiter, sleep_mock: mock.AsyncMock):
+        async with rate_limiter.acquire():
+            pass
+        async with rate_limiter.acquire():
+            pass
+
+        sleep_mock.assert_called_once_with(pytest.approx(0.01))
+
+    async def test_increases_rate_on_success(
+        self, rate_limiter: AIMDRateLimiter, clock: mock.MagicMock, sleep_mock: mock.AsyncMock
+    ):
+        clock.return_value += 1
+        async with rate_limiter.acquire():
+            pass
+
+        assert rate_limiter.rate == 101
+
+    async def test_increases_rate_with_time_not_request_count(self, clock: mock.MagicMock, sleep_mock: mock.AsyncMock):
+        rate_limiter = AIMDRateLimiter(initial_rate=100, max_rate=10000, rate_increase=2)
+
+        for _ in range(1000):
+            async with rate_limiter.acquire():
+                pass
+        assert rate_limiter.rate == 100
+
+        for _ in range(10):
+            clock.return_value += 0.5
+            async with rate_limiter.acquire():
+                pass
+        assert rate_limiter.rate == pytest.approx(110)
+
+    async def test_halves_rate_on_back_pressure(self, rate_limiter: AIMDRateLimiter, sleep_mock: mock.AsyncMock):
+        with pytest.raises(ZeebeBackPressureError):
+            async with rate_limiter.acquire():
+                raise ZeebeBackPressureError()
+
+        assert rate_limiter.rate == 50
+
+    async def test_halves_rate_once_for_concurrent_back_pressure(
+        self, rate_limiter: AIMDRateLimiter, sleep_mock: mock.AsyncMock
+    ):
+        in_flight = []
+        rejected = asyncio.Event()
+
+        async def request():
+            async with rate_limiter.acquire():
+                in_flight.append(request)
+                if len(in_flight) == 100:
+                    rejected.set()
+                await rejected.wait()
+                raise ZeebeBackPressureError()
+
+        results = await asyncio.gather(*(request() for _ in range(100)), return_exceptions=True)
+
+        assert all(isinstance(result, ZeebeBackPressureError) for result in results)
+        assert rate_limiter.rate == 50
+
+    async def test_halves_rate_again_for_requests_sent_after_decrease(
+        self, rate_limiter: AIMDRateLimiter, sleep_mock: mock.AsyncMock
+    ):
+        for _ in range(2):
+            with pytest.raises(ZeebeBackPressureError):
+                async with rate_limiter.acquire():
+                    raise ZeebeBackPressureError()
+
+        assert rate_limiter.rate == 25
+
+    async def test_keeps_rate_on_other_errors(self, rate_limiter: AIMDRateLimiter, sleep_mock: mock.AsyncMock):
+        with pytest.raises(ZeebeGatewayUnavailableError):
+            async with rate_limiter.acquire():
+                raise ZeebeGatewayUnavailableError()
+
+        assert rate_limiter.rate == 100
+
+
+@pytest.mark.asyncio
+class TestRun:
+    async def test_returns_request_result(self, rate_limiter: AIMDRateLimiter, sleep_mock: mock.AsyncMock):
+        async def request():
+            return 1
+
+        assert await rate_limiter.run(request()) == 1
+
+    async def test_closes_request_cancelled_while_waiting(self, rate_limiter: AIMDRateLimiter):
+        async def request():
+            return 1
+
+        pending_request = request()
+        with mock.patch("pyzeebe.client.rate_limiter.asyncio.sleep", side_effect=asyncio.CancelledError()):
+            rate_limiter._next_request_at = float("inf")
+            with pytest.raises(asyncio.CancelledError):
+                await rate_limiter.run(pending_request)
+
+        assert pending_request.cr_frame is None
+
+
+class TestRateBounds:
+    def test_rate_does_not_exceed_max_rate(self, rate_limiter: AIMDRateLimiter, clock: mock.MagicMock):
+        for _ in range(10):
+            clock.return_value += 1
+            rate_limiter.on_success()
+
+        assert rate_limiter.rate == 101
+
+    def test_rate_does_not_drop_below_min_rate(self, rate_limiter: AIMDRateLimiter):
+        for _ in range(10):
+            rate_limiter.on_overload()
+
+        assert rate_limiter.rate == 10
@@ -1,10 +1,10 @@
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 import grpc
 import pytest
 
-from pyzeebe import SyncZeebeClient
+from pyzeebe import SyncZeebeClient, ZeebeClient
 from pyzeebe.errors import ProcessDefinitionNotFoundError
 
 
@@ -66,30 +66,38 @@ class TestCancelProcessInstance:
 
 class TestDeployProcess:
     def test_calls_deploy_process_of_zeebe_client(self, sync_zeebe_client: SyncZeebeClient):
-        sync_zeebe_client.client.deploy_process = AsyncMock()
         file_path = str(uuid4())
 
-        sync_zeebe_client.deploy_process(file_path)
+        with patch.object(ZeebeClient, "deploy_process", new_callable=AsyncMock) as deploy_process_mock:
+            sync_zeebe_client.deploy_process(file_path)
 
-        sync_zeebe_client.client.deploy_process.assert_called_with(file_path)
+        deploy_process_mock.assert_called_with(file_path)
 
 
 class TestDeployResource:
     def test_calls_deploy_resource_of_zeebe_client(self, sync_zeebe_client: SyncZeebeClient):
-        sync_zeebe_client.client.deploy_resource = AsyncMock()
         file_path = str(uuid4())
 
-        sync_zeebe_client.deploy_resource(file_path)
+        with patch.object(ZeebeClient, "deploy_resource", new_callable=AsyncMock) as deploy_resource_mock:
+            sync_zeebe_client.deploy_resource(file_path)
 
-        sync_zeebe_client.client.deploy_resource.assert_called_with(file_path, tenant_id=None)
+        deploy_resource_mock.assert_called_with(file_path, tenant_id=None)
 
 
 class TestPublishMessage:
     def test_calls_publish_message_of_zeebe_client(self, sync_zeebe_client: SyncZeebeClient):
-        sync_zeebe_client.client.publish_message = AsyncMock()
         name = str(uuid4())
         correlation_key = str(uuid4())
 
-        sync_zeebe_client.publish_message(name, correlation_key)
+        with patch.object(ZeebeClient, "publish_message", new_callable=AsyncMock) as publish_message_mock:
+            sync_zeebe_client.publish_message(name, correlation_key)
 
-        sync_zeebe_client.client.publish_message.assert_called_once()
+        publish_message_mock.assert_called_once()
+
+
+class TestClose:
+    def test_calls_close_of_zeebe_client(self, sync_zeebe_client: SyncZeebeClient):
+        with patch.object(ZeebeClient, "close", new_callable=AsyncMock) as close_mock:
+            sync_zeebe_client.close()
+
+        close_mock.assert_called_once()
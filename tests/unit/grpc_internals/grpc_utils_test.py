@@ -1,3 +1,6 @@
+import json
+from types import MappingProxyType
+
 import grpc
 
 from pyzeebe.grpc_internals import grpc_utils
@@ -16,3 +19,14 @@ class TestIsErrorStatus:
 
     def test_with_matching_and_unmatching_code_returns_true(self):
         assert grpc_utils.is_error_status(self.error, self.matching_status_code, self.unmatching_status_code)
+
+
+class TestSerializeVariables:
+    def test_serializes_dict(self):
+        assert json.loads(grpc_utils.serialize_variables({"x": 1})) == {"x": 1}
+
+    def test_serializes_empty_mapping(self):
+        assert grpc_utils.serialize_variables(MappingProxyType({})) == "{}"
+
+    def test_serializes_non_dict_mapping(self):
+        assert json.loads(grpc_utils.serialize_variables(MappingProxyType({"x": 1}))) == {"x": 1}
@@ -2,9 +2,10 @@ from random import randint
 from uuid import uuid4
 
 import pytest
-from zeebe_grpc.gateway_pb2 import PublishMessageResponse
+from zeebe_grpc.gateway_pb2 import PublishMessageRequest, PublishMessageResponse
 
 from pyzeebe.errors import MessageAlreadyExistsError
+from pyzeebe.grpc_internals import zeebe_message_adapter
 from pyzeebe.grpc_internals.zeebe_message_adapter import ZeebeMessageAdapter
 from tests.unit.utils.random_utils import RANDOM_RANGE
 
@@ -52,3 +53,27 @@ class TestPublishMessage:
         with pytest.raises(MessageAlreadyExistsError):
             await self.publish_message(message_id=message_id)
             await self.publish_message(message_id=message_id)
+
+    async def test_publishes_message_without_variables_and_message_id(self):
+        response = await self.zeebe_message_adapter.publish_message(str(uuid4()), str(uuid4()), 60000, {})
+
+        assert isinstance(response, PublishMessageResponse)
+
+
+class TestSerializeSignalRequest:
+    def test_is_cached(self):
+        name, correlation_key = str(uuid4()), str(uuid4())
+
+        first = zeebe_message_adapter._serialize_signal_request(name, correlation_key, 60000, None)
+        second = zeebe_message_adapter._serialize_signal_request(name, correlation_key, 60000, None)
+
+        assert first is second
+
+    def test_matches_regular_request(self):
+        name, correlation_key, tenant_id = str(uuid4()), str(uuid4()), str(uuid4())
+
+        serialized_request = zeebe_message_adapter._serialize_signal_request(name, correlation_key, 60000, tenant_id)
+
+        assert PublishMessageRequest.FromString(serialized_request) == PublishMessageRequest(
+            name=name, correlationKey=correlation_key, timeToLive=60000, variables="{}", tenantId=tenant_id
+        )
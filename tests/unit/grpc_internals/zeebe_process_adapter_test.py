@@ -4,6 +4,7 @@ from uuid import uuid4
 
 import grpc
 import pytest
+from zeebe_grpc.gateway_pb2 import CreateProcessInstanceWithResultResponse
 
 from pyzeebe.errors import (
     InvalidJSONError,
@@ -122,6 +123,38 @@ class TestCreateProcessWithResult:
             )
 
 
+@pytest.mark.asyncio
+class TestCreateProcessWithResultAll:
+    async def test_returns_key_and_variables(self, zeebe_adapter: ZeebeProcessAdapter, grpc_servicer: GatewayMock):
+        bpmn_process_id = str(uuid4())
+        version = randint(0, 10)
+        grpc_servicer.mock_deploy_process(bpmn_process_id, version, [])
+
+        process_instance_key, variables = await zeebe_adapter.create_process_instance_with_result_all(
+            bpmn_process_id, version, {}, 0
+        )
+
+        assert isinstance(process_instance_key, int)
+        assert isinstance(variables, dict)
+
+    async def test_does_not_send_variables_to_fetch(self, zeebe_adapter: ZeebeProcessAdapter):
+        zeebe_adapter._gateway_stub.CreateProcessInstanceWithResult = AsyncMock(
+            return_value=CreateProcessInstanceWithResultResponse(processInstanceKey=1, variables="{}")
+        )
+
+        await zeebe_adapter.create_process_instance_with_result_all(str(uuid4()), -1, {}, 0)
+
+        request = zeebe_adapter._gateway_stub.CreateProcessInstanceWithResult.call_args.args[0]
+        assert len(request.fetchVariables) == 0
+
+    async def test_raises_on_process_timeout(self, zeebe_adapter: ZeebeProcessAdapter):
+        error = grpc.aio.AioRpcError(grpc.StatusCode.DEADLINE_EXCEEDED, None, None)
+        zeebe_adapter._gateway_stub.CreateProcessInstanceWithResult = AsyncMock(side_effect=error)
+
+        with pytest.raises(ProcessTimeoutError):
+            await zeebe_adapter.create_process_instance_with_result_all(str(uuid4()), -1, {}, 0)
+
+
 @pytest.mark.asyncio
 class TestCancelProcess:
     async def test_cancels_the_process(self, zeebe_adapter: ZeebeProcessAdapter, grpc_servicer: GatewayMock):
@@ -181,3 +214,43 @@ class TestDeployResource:
         await zeebe_adapter.deploy_resource(file_path)
 
         mocked_aiofiles_open.assert_called_with(file_path, "rb")
+
+    async def test_sends_all_resources_in_order(self, zeebe_adapter: ZeebeProcessAdapter, mocked_aiofiles_open):
+        file_paths = [str(uuid4()) for _ in range(3)]
+        zeebe_adapter._gateway_stub.DeployResource = AsyncMock()
+
+        await zeebe_adapter.deploy_resource(*file_paths)
+
+        request = zeebe_adapter._gateway_stub.DeployResource.call_args.args[0]
+        assert [resource.name for resource in request.resources] == file_paths
+
+
+@pytest.mark.asyncio
+class TestRpcTimeout:
+    @pytest.fixture
+    def zeebe_adapter(self, aio_grpc_channel: grpc.aio.Channel) -> ZeebeProcessAdapter:
+        return ZeebeProcessAdapter(aio_grpc_channel, rpc_timeout=30)
+
+    async def test_sets_deadline_on_request(self, zeebe_adapter: ZeebeProcessAdapter):
+        zeebe_adapter._gateway_stub.CancelProcessInstance = AsyncMock()
+
+        await zeebe_adapter.cancel_process_instance(randint(0, RANDOM_RANGE))
+
+        assert zeebe_adapter._gateway_stub.CancelProcessInstance.call_args.kwargs["timeout"] == 30
+
+    async def test_deadline_includes_process_timeout(self, zeebe_adapter: ZeebeProcessAdapter):
+        zeebe_adapter._gateway_stub.CreateProcessInstanceWithResult = AsyncMock(
+            return_value=CreateProcessInstanceWithResultResponse(processInstanceKey=1, variables="{}")
+        )
+
+        await zeebe_adapter.create_process_instance_with_result_all(str(uuid4()), -1, {}, 5000)
+
+        assert zeebe_adapter._gateway_stub.CreateProcessInstanceWithResult.call_args.kwargs["timeout"] == 35
+
+    async def test_no_deadline_by_default(self, aio_grpc_channel: grpc.aio.Channel):
+        zeebe_adapter = ZeebeProcessAdapter(aio_grpc_channel)
+        zeebe_adapter._gateway_stub.CancelProcessInstance = AsyncMock()
+
+        await zeebe_adapter.cancel_process_instance(randint(0, RANDOM_RANGE))
+
+        assert zeebe_adapter._gateway_stub.CancelProcessInstance.call_args.kwargs["timeout"] is None
@@ -262,3 +262,44 @@ class TestBuildJobHandler:
 
     def function_with_job_parameter(x: int, job: Job):
         return {"received_job": job}
+
+
+class TestCreateDecoratorRunner:
+    def test_returns_none_without_decorators(self):
+        assert task_builder.create_decorator_runner([]) is None
+
+    @pytest.mark.asyncio
+    async def test_runs_single_decorator(self, decorator: TaskDecorator, mocked_job_with_adapter: Job):
+        decorator_runner = task_builder.create_decorator_runner([decorator])
+
+        assert await decorator_runner(mocked_job_with_adapter) == mocked_job_with_adapter
+        decorator.assert_called_once_with(mocked_job_with_adapter)
+
+    @pytest.mark.asyncio
+    async def test_decorators_are_fixed_when_runner_is_created(
+        self, decorator: TaskDecorator, mocked_job_with_adapter: Job
+    ):
+        decorators = [decorator, decorator]
+        decorator_runner = task_builder.create_decorator_runner(decorators)
+
+        decorators.append(decorator)
+        await decorator_runner(mocked_job_with_adapter)
+
+        assert decorator.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_runs_decorators_in_order(self, mocked_job_with_adapter: Job):
+        calls = []
+
+        async def first(job: Job) -> Job:
+            calls.append("first")
+            return job
+
+        async def second(job: Job) -> Job:
+            calls.append("second")
+            return job
+
+        decorator_runner = task_builder.create_decorator_runner([first, second])
+
+        assert await decorator_runner(mocked_job_with_adapter) == mocked_job_with_adapter
+        assert calls == ["first", "second"]
@@ -1,3 +1,5 @@
+import sys
+
 from pyzeebe.job.job import Job
 from pyzeebe.task.task_config import TaskConfig
 from tests.unit.utils.function_tools import functions_are_all_async
@@ -46,3 +48,10 @@ class TestConstructor:
         )
 
         assert functions_are_all_async(task_config.after)
+
+    def test_type_is_interned(self):
+        task_type = "".join(["task", "-", "type"])
+
+        task_config = TaskConfig(task_type, self.exception_handler, 10000, 32, 32, [], False, "", [], [])
+
+        assert task_config.type is sys.intern("task-type")
@@ -31,6 +31,29 @@ class TestExecuteOneJob:
         await job_executor.execute_one_job(job_from_task)
 
 
+@pytest.mark.asyncio
+class TestExecute:
+    async def test_keeps_reference_to_running_job(self, job_executor: JobExecutor, job_from_task: Job, task: Task):
+        job_started, job_may_finish = asyncio.Event(), asyncio.Event()
+
+        async def job_handler(job: Job) -> None:
+            job_started.set()
+            await job_may_finish.wait()
+
+        task.job_handler = job_handler
+        await job_executor.jobs.put(job_from_task)
+        execute_task = asyncio.create_task(job_executor.execute())
+        await job_started.wait()
+
+        assert len(job_executor.running_jobs) == 1
+
+        job_may_finish.set()
+        await job_executor.jobs.join()
+        execute_task.cancel()
+
+        assert len(job_executor.running_jobs) == 0
+
+
 @pytest.mark.asyncio
 class TestGetNextJob:
     async def test_returns_expected_job(self, job_executor: JobExecutor, job_from_task: Job):
@@ -1,3 +1,4 @@
+import itertools
 from unittest import mock
 from uuid import uuid4
 
@@ -11,15 +12,21 @@ from pyzeebe.task.task import Task
 from pyzeebe.worker.task_router import ZeebeTaskRouter
 from tests.unit.utils.random_utils import randint
 
+task_type_counter = itertools.count()
+
 
 def test_get_task(router: ZeebeTaskRouter, task: Task):
-    router.tasks.append(task)
+    router._add_task(task)
 
     found_task = router.get_task(task.type)
 
     assert found_task == task
 
 
+def test_router_has_no_instance_dict(router: ZeebeTaskRouter):
+    assert not hasattr(router, "__dict__")
+
+
 def test_task_inherits_exception_handler(router: ZeebeTaskRouter, task: Task):
     router._exception_handler = str
     router.task(task.type)(task.original_function)
@@ -36,7 +43,7 @@ def test_get_fake_task(router: ZeebeTaskRouter):
 
 
 def test_get_task_index(router: ZeebeTaskRouter, task: Task):
-    router.tasks.append(task)
+    router._add_task(task)
 
     index = router._get_task_index(task.type)
 
@@ -44,7 +51,7 @@ def test_get_task_index(router: ZeebeTaskRouter, task: Task):
 
 
 def test_get_task_and_index(router: ZeebeTaskRouter, task: Task):
-    router.tasks.append(task)
+    router._add_task(task)
 
     found_task, index = router._get_task_and_index(task.type)
 
@@ -53,7 +60,7 @@ def test_get_task_and_index(router: ZeebeTaskRouter, task: Task):
 
 
 def test_remove_task(router: ZeebeTaskRouter, task: Task):
-    router.tasks.append(task)
+    router._add_task(task)
 
     router.remove_task(task.type)
 
@@ -61,11 +68,11 @@ def test_remove_task(router: ZeebeTaskRouter, task: Task):
 
 
 def test_remove_task_from_many(router: ZeebeTaskRouter, task: Task):
-    router.tasks.append(task)
+    router._add_task(task)
 
     for _ in range(1, randint(0, 100)):
 
-        @router.task(str(uuid4()))
+        @router.task(f"t{next(task_type_counter)}")
         def dummy_function():
             pass
 
@@ -74,13 +81,89 @@ def test_remove_task_from_many(router: ZeebeTaskRouter, task: Task):
     assert task not in router.tasks
 
 
+def test_get_task_after_removing_earlier_task(router: ZeebeTaskRouter, task: Task):
+    router._add_task(task)
+    task_types = [str(uuid4()) for _ in range(3)]
+    for task_type in task_types:
+        router.task(task_type)(task.original_function)
+
+    router.remove_task(task_types[0])
+
+    for task_type in task_types[1:]:
+        found_task, index = router._get_task_and_index(task_type)
+        assert found_task.type == task_type
+        assert router.tasks[index] is found_task
+
+
+def test_tasks_keep_registration_order(router: ZeebeTaskRouter, task: Task):
+    task_types = [str(uuid4()) for _ in range(3)]
+    for task_type in task_types:
+        router.task(task_type)(task.original_function)
+
+    router.remove_task(task_types[0])
+
+    assert [found_task.type for found_task in router.tasks] == [task_types[1], task_types[2]]
+    assert router._get_task_index(task_types[2]) == 1
+
+
+def test_tasks_contains_only_registered_instance(router: ZeebeTaskRouter, task: Task):
+    router.task(task.type)(task.original_function)
+
+    assert router.get_task(task.type) in router.tasks
+    assert task not in router.tasks
+
+
+def test_append_to_tasks(router: ZeebeTaskRouter, task: Task):
+    router.tasks.append(task)
+
+    assert router.get_task(task.type) is task
+
+
+def test_append_duplicate_task_type(router: ZeebeTaskRouter, task: Task):
+    router.tasks.append(task)
+
+    with pytest.raises(DuplicateTaskTypeError):
+        router.tasks.append(task)
+
+    assert router.get_task(task.type) is task
+
+
+def test_remove_from_tasks(router: ZeebeTaskRouter, task: Task):
+    router.tasks.append(task)
+
+    router.tasks.remove(task)
+
+    assert task not in router.tasks
+    with pytest.raises(TaskNotFoundError):
+        router.get_task(task.type)
+
+
+def test_remove_unregistered_task_from_tasks(router: ZeebeTaskRouter, task: Task):
+    router.task(task.type)(task.original_function)
+
+    with pytest.raises(ValueError):
+        router.tasks.remove(task)
+
+    assert len(router.tasks) == 1
+
+
+def test_remove_last_task(router: ZeebeTaskRouter, task: Task):
+    router._add_task(task)
+
+    router.remove_task(task.type)
+
+    assert len(router.tasks) == 0
+    with pytest.raises(TaskNotFoundError):
+        router.get_task(task.type)
+
+
 def test_remove_fake_task(router: ZeebeTaskRouter):
     with pytest.raises(TaskNotFoundError):
         router.remove_task(str(uuid4()))
 
 
 def test_check_is_task_duplicate_with_duplicate(router: ZeebeTaskRouter, task: Task):
-    router.tasks.append(task)
+    router._add_task(task)
     with pytest.raises(DuplicateTaskTypeError):
         router._is_task_duplicate(task.type)
 
@@ -119,6 +202,17 @@ def test_add_after_decorator_through_constructor(decorator: TaskDecorator):
     assert len(router._after) == 1
 
 
+def test_constructor_decorators_are_copied(decorator: TaskDecorator):
+    before, after = [decorator], [decorator]
+    router = ZeebeTaskRouter(before=before, after=after)
+
+    router.before(decorator)
+    router.after(decorator)
+
+    assert len(before) == 1
+    assert len(after) == 1
+
+
 def test_set_exception_handler_through_constructor(exception_handler: ExceptionHandler):
     router = ZeebeTaskRouter(exception_handler=exception_handler)
 
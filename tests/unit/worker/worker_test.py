@@ -1,3 +1,4 @@
+import itertools
 from typing import List
 from unittest.mock import AsyncMock
 from uuid import uuid4
@@ -11,6 +12,16 @@ from pyzeebe.job.job import Job
 from pyzeebe.task.task import Task
 from pyzeebe.worker.worker import ZeebeWorker
 
+task_type_counter = itertools.count()
+
+
+def dummy_function():
+    return {}
+
+
+def dummy_function_with_error():
+    raise Exception()
+
 
 class TestAddTask:
     def test_add_task(self, zeebe_worker: ZeebeWorker, task: Task):
@@ -183,12 +194,8 @@ class TestIncludeRouter:
 
     @staticmethod
     def include_router_with_task(zeebe_worker: ZeebeWorker, router: ZeebeTaskRouter, task_type: str = None) -> Task:
-        task_type = task_type or str(uuid4())
-
-        @router.task(task_type)
-        def dummy_function():
-            return {}
-
+        task_type = task_type or f"t{next(task_type_counter)}"
+        router.task(task_type)(dummy_function)
         zeebe_worker.include_router(router)
         return zeebe_worker.get_task(task_type)
 
@@ -196,11 +203,7 @@ class TestIncludeRouter:
     def include_router_with_task_error(
         zeebe_worker: ZeebeWorker, router: ZeebeTaskRouter, task_type: str = None
     ) -> Task:
-        task_type = task_type or str(uuid4())
-
-        @router.task(task_type)
-        def dummy_function():
-            raise Exception()
-
+        task_type = task_type or f"t{next(task_type_counter)}"
+        router.task(task_type)(dummy_function_with_error)
         zeebe_worker.include_router(router)
         return zeebe_worker.get_task(task_type)